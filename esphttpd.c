@@ -772,8 +772,11 @@ static void webserver_task()
 		clientfd = accept(sockfd, (struct sockaddr *)&client_addr, &addrlen);
 
     ESP_LOGI(TAG, "%s:%d connected", inet_ntoa(client_addr.sin_addr), ntohs(client_addr.sin_port));
-    //int flags =1;
-    //setsockopt(clientfd, IPPROTO_TCP, TCP_NODELAY, (void *)&flags, sizeof(flags));
+
+    // Status, headers and body go out as separate small sends, so disable
+    // Nagle to avoid stalling on the client's delayed ACK
+    int flags = 1;
+    setsockopt(clientfd, IPPROTO_TCP, TCP_NODELAY, (void *)&flags, sizeof(flags));
 
 		webserver_serve(clientfd);
 	}